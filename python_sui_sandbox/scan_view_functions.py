@@ -322,6 +322,7 @@ def extract_view_functions(package_id: str, interface: dict) -> list[dict]:
     for mod_name, mod_data in modules.items():
         if not isinstance(mod_data, dict):
             continue
+        target_prefix = f"{package_id}::{mod_name}::"
         functions = mod_data.get("functions", {})
         for fn_name, fn_data in functions.items():
             if not isinstance(fn_data, dict):
@@ -343,7 +344,7 @@ def extract_view_functions(package_id: str, interface: dict) -> list[dict]:
                 continue
 
             category = _categorize_view_function(params, returns)
-            target = f"{package_id}::{mod_name}::{fn_name}"
+            target = target_prefix + fn_name
 
             view_fns.append({
                 "module": mod_name,